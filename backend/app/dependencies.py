@@ -15,36 +15,41 @@ _driver_repository = DriverRepository()
 _truck_repository = TruckRepository()
 _assignment_repository = AssignmentRepository()
 
+# Services hold no per-request state, so a single instance of each is shared
+_driver_service = DriverService(_driver_repository)
+_truck_service = TruckService(_truck_repository)
+_assignment_service = AssignmentService(
+    _assignment_repository,
+    _driver_repository,
+    _truck_repository
+)
+
 
 def get_driver_service() -> DriverService:
     """
-    Returns a DriverService instance with its dependencies.
+    Returns the shared DriverService instance.
 
     Returns:
         DriverService: Driver service instance
     """
-    return DriverService(_driver_repository)
+    return _driver_service
 
 
 def get_truck_service() -> TruckService:
     """
-    Returns a TruckService instance with its dependencies.
+    Returns the shared TruckService instance.
 
     Returns:
         TruckService: Truck service instance
     """
-    return TruckService(_truck_repository)
+    return _truck_service
 
 
 def get_assignment_service() -> AssignmentService:
     """
-    Returns an AssignmentService instance with its dependencies.
+    Returns the shared AssignmentService instance.
 
     Returns:
         AssignmentService: Assignment service instance
     """
-    return AssignmentService(
-        _assignment_repository,
-        _driver_repository,
-        _truck_repository
-    )
+    return _assignment_service
@@ -4,7 +4,7 @@ Represents the relationship between a driver and a truck for a specific date.
 """
 from typing import Optional
 from datetime import date
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Assignment(BaseModel):
@@ -22,9 +22,8 @@ class Assignment(BaseModel):
     truck_id: int = Field(..., gt=0, description="ID of the truck")
     assignment_date: date = Field(..., description="Date of the assignment")
 
-    class Config:
-        """Pydantic configuration"""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "driver_id": 1,
@@ -32,3 +31,4 @@ class Assignment(BaseModel):
                 "assignment_date": "2025-11-10"
             }
         }
+    )
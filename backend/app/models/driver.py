@@ -3,7 +3,7 @@ Driver domain model.
 Represents a driver entity with their license information.
 """
 from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from .license_type import LicenseType
 
 
@@ -40,12 +40,12 @@ class Driver(BaseModel):
             raise ValueError("Driver name cannot be empty or only whitespace")
         return normalized
 
-    class Config:
-        """Pydantic configuration"""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "name": "John Doe",
                 "license_type": "D"
             }
         }
+    )
@@ -3,7 +3,13 @@ License type enumeration and validation logic.
 Implements the hierarchy of driver's license types.
 """
 from enum import Enum
-from typing import Set
+from types import MappingProxyType
+from typing import FrozenSet, Mapping
+
+
+# Hierarchy level of each license type; higher numbers indicate higher privilege levels.
+# Read-only, since the same mapping is handed out to every caller.
+_HIERARCHY: Mapping[str, int] = MappingProxyType({"A": 1, "B": 2, "C": 3, "D": 4, "E": 5})
 
 
 class LicenseType(str, Enum):
@@ -19,18 +25,12 @@ class LicenseType(str, Enum):
     E = "E"
 
     @staticmethod
-    def get_license_hierarchy() -> dict[str, int]:
+    def get_license_hierarchy() -> Mapping[str, int]:
         """
         Returns the hierarchy level of each license type.
         Higher numbers indicate higher privilege levels.
         """
-        return {
-            LicenseType.A.value: 1,
-            LicenseType.B.value: 2,
-            LicenseType.C.value: 3,
-            LicenseType.D.value: 4,
-            LicenseType.E.value: 5,
-        }
+        return _HIERARCHY
 
     def can_operate(self, required_license: "LicenseType") -> bool:
         """
@@ -42,20 +42,24 @@ class LicenseType(str, Enum):
         Returns:
             bool: True if this license meets or exceeds the requirement
         """
-        hierarchy = self.get_license_hierarchy()
-        return hierarchy[self.value] >= hierarchy[required_license.value]
+        return self._rank >= required_license._rank
 
-    def get_compatible_licenses(self) -> Set[str]:
+    def get_compatible_licenses(self) -> FrozenSet[str]:
         """
         Returns all license types that this license can cover.
 
         Returns:
-            Set[str]: Set of compatible license type values
+            FrozenSet[str]: Set of compatible license type values
         """
-        hierarchy = self.get_license_hierarchy()
-        current_level = hierarchy[self.value]
-        return {
-            license_type
-            for license_type, level in hierarchy.items()
-            if level <= current_level
-        }
+        return self._compatible
+
+
+# Precomputed once, since the hierarchy is fixed
+for _license_type in LicenseType:
+    _license_type._rank = _HIERARCHY[_license_type.value]
+    _license_type._compatible = frozenset(
+        value
+        for value, level in _HIERARCHY.items()
+        if level <= _license_type._rank
+    )
+del _license_type
@@ -3,11 +3,14 @@ Truck domain model.
 Represents a truck entity with its license requirements.
 """
 from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from .license_type import LicenseType
 import re
 
 
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
 class Truck(BaseModel):
     """
     Truck entity representing a vehicle that requires a driver.
@@ -40,16 +43,18 @@ class Truck(BaseModel):
         if not normalized:
             raise ValueError("Truck plate cannot be empty or only whitespace")
 
-        # Remove extra spaces and normalize format
-        normalized = re.sub(r'\s+', ' ', normalized)
+        # Remove extra spaces and normalize format. Every whitespace character
+        # other than ' ' is non-printable, so plates without any skip the regex.
+        if ' ' in normalized or not normalized.isprintable():
+            normalized = _WHITESPACE_RE.sub(' ', normalized)
         return normalized
 
-    class Config:
-        """Pydantic configuration"""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "plate": "ABC-1234",
                 "minimum_license_type": "C"
             }
         }
+    )
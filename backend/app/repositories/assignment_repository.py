@@ -2,11 +2,31 @@
 Assignment repository for data persistence operations.
 Implements the Repository Pattern to separate business logic from data access.
 """
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
+from bisect import bisect_left, insort
+from dataclasses import dataclass
 from datetime import date
 from app.models.assignment import Assignment
 
 
+@dataclass(slots=True)
+class _AssignmentRecord:
+    """Compact storage row for an assignment that was validated on the way in"""
+    id: int
+    driver_id: int
+    truck_id: int
+    assignment_date: date
+
+    def to_model(self) -> Assignment:
+        """Rebuilds the domain model without re-running validation"""
+        return Assignment.model_construct(
+            id=self.id,
+            driver_id=self.driver_id,
+            truck_id=self.truck_id,
+            assignment_date=self.assignment_date
+        )
+
+
 class AssignmentRepository:
     """
     Handles data persistence for Assignment entities.
@@ -15,8 +35,13 @@ class AssignmentRepository:
 
     def __init__(self):
         """Initialize the repository with empty storage"""
-        self._assignments: dict[int, Assignment] = {}
+        self._assignments: dict[int, _AssignmentRecord] = {}
         self._next_id: int = 1
+        # Secondary indexes kept in sync on every write for O(1) conflict checks
+        self._by_driver_date: dict[tuple[int, date], int] = {}
+        self._by_truck_date: dict[tuple[int, date], int] = {}
+        # Per-date IDs kept in ascending (insertion) order, so reads need no sort
+        self._by_date: dict[date, list[int]] = {}
 
     def create(self, assignment: Assignment) -> Assignment:
         """
@@ -29,10 +54,31 @@ class AssignmentRepository:
             Assignment: The created assignment with assigned ID
         """
         assignment.id = self._next_id
-        self._assignments[self._next_id] = assignment
+        record = _AssignmentRecord(
+            assignment.id,
+            assignment.driver_id,
+            assignment.truck_id,
+            assignment.assignment_date
+        )
+        self._assignments[record.id] = record
+        self._add_to_indexes(record)
         self._next_id += 1
         return assignment
 
+    def bulk_create(self, assignments: List[Assignment]) -> List[Assignment]:
+        """
+        Creates several assignments in one call, assigning consecutive IDs.
+
+        Conflict rules are enforced by the service layer, not here.
+
+        Args:
+            assignments: Assignment entities to create
+
+        Returns:
+            List[Assignment]: The created assignments with assigned IDs, in input order
+        """
+        return [self.create(assignment) for assignment in assignments]
+
     def get_by_id(self, assignment_id: int) -> Optional[Assignment]:
         """
         Retrieves an assignment by its ID.
@@ -43,7 +89,7 @@ class AssignmentRepository:
         Returns:
             Optional[Assignment]: The assignment if found, None otherwise
         """
-        return self._assignments.get(assignment_id)
+        return self._to_model(self._assignments.get(assignment_id))
 
     def get_all(self) -> List[Assignment]:
         """
@@ -52,7 +98,19 @@ class AssignmentRepository:
         Returns:
             List[Assignment]: List of all assignments
         """
-        return list(self._assignments.values())
+        return [record.to_model() for record in self._assignments.values()]
+
+    def iter_all(self) -> Iterator[Assignment]:
+        """
+        Iterates over all assignments, building each one only when requested.
+
+        Returns:
+            Iterator[Assignment]: Iterator over all assignments
+        """
+        # Iterate over a snapshot of the records so writes made while a consumer
+        # is suspended cannot invalidate the iteration
+        for record in tuple(self._assignments.values()):
+            yield record.to_model()
 
     def update(self, assignment_id: int, assignment: Assignment) -> Optional[Assignment]:
         """
@@ -65,11 +123,20 @@ class AssignmentRepository:
         Returns:
             Optional[Assignment]: The updated assignment if found, None otherwise
         """
-        if assignment_id not in self._assignments:
+        existing = self._assignments.get(assignment_id)
+        if existing is None:
             return None
 
+        self._remove_from_indexes(existing)
         assignment.id = assignment_id
-        self._assignments[assignment_id] = assignment
+        record = _AssignmentRecord(
+            assignment_id,
+            assignment.driver_id,
+            assignment.truck_id,
+            assignment.assignment_date
+        )
+        self._assignments[assignment_id] = record
+        self._add_to_indexes(record)
         return assignment
 
     def delete(self, assignment_id: int) -> bool:
@@ -82,10 +149,12 @@ class AssignmentRepository:
         Returns:
             bool: True if assignment was deleted, False if not found
         """
-        if assignment_id in self._assignments:
-            del self._assignments[assignment_id]
-            return True
-        return False
+        record = self._assignments.pop(assignment_id, None)
+        if record is None:
+            return False
+
+        self._remove_from_indexes(record)
+        return True
 
     def find_by_driver_and_date(self, driver_id: int, assignment_date: date) -> Optional[Assignment]:
         """
@@ -98,11 +167,8 @@ class AssignmentRepository:
         Returns:
             Optional[Assignment]: The assignment if found, None otherwise
         """
-        for assignment in self._assignments.values():
-            if (assignment.driver_id == driver_id and
-                assignment.assignment_date == assignment_date):
-                return assignment
-        return None
+        assignment_id = self._by_driver_date.get((driver_id, assignment_date))
+        return self._to_model(self._assignments.get(assignment_id))
 
     def find_by_truck_and_date(self, truck_id: int, assignment_date: date) -> Optional[Assignment]:
         """
@@ -115,11 +181,31 @@ class AssignmentRepository:
         Returns:
             Optional[Assignment]: The assignment if found, None otherwise
         """
-        for assignment in self._assignments.values():
-            if (assignment.truck_id == truck_id and
-                assignment.assignment_date == assignment_date):
-                return assignment
-        return None
+        assignment_id = self._by_truck_date.get((truck_id, assignment_date))
+        return self._to_model(self._assignments.get(assignment_id))
+
+    def conflicts(
+        self,
+        driver_id: int,
+        truck_id: int,
+        assignment_date: date
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Looks up the assignments already booking a driver or a truck on a date.
+
+        Args:
+            driver_id: The driver's ID
+            truck_id: The truck's ID
+            assignment_date: The date to check
+
+        Returns:
+            Tuple[Optional[int], Optional[int]]: IDs of the assignments holding the
+            driver and the truck on that date, None where the slot is free
+        """
+        return (
+            self._by_driver_date.get((driver_id, assignment_date)),
+            self._by_truck_date.get((truck_id, assignment_date))
+        )
 
     def find_by_date(self, assignment_date: date) -> List[Assignment]:
         """
@@ -132,7 +218,63 @@ class AssignmentRepository:
             List[Assignment]: List of assignments on that date
         """
         return [
-            assignment
-            for assignment in self._assignments.values()
-            if assignment.assignment_date == assignment_date
+            self._assignments[assignment_id].to_model()
+            for assignment_id in self._by_date.get(assignment_date, ())
         ]
+
+    def clear(self) -> None:
+        """Removes every assignment and its index entries, restarting IDs from 1"""
+        self._assignments.clear()
+        self._by_driver_date.clear()
+        self._by_truck_date.clear()
+        self._by_date.clear()
+        self._next_id = 1
+
+    @staticmethod
+    def _to_model(record: Optional[_AssignmentRecord]) -> Optional[Assignment]:
+        """
+        Converts a stored record into an Assignment, passing None through.
+
+        Args:
+            record: The stored record, if any
+
+        Returns:
+            Optional[Assignment]: The assignment if a record was given, None otherwise
+        """
+        return record.to_model() if record is not None else None
+
+    def _add_to_indexes(self, assignment: _AssignmentRecord) -> None:
+        """
+        Registers an assignment in the secondary indexes.
+
+        Args:
+            assignment: Stored assignment record
+        """
+        self._by_driver_date[(assignment.driver_id, assignment.assignment_date)] = assignment.id
+        self._by_truck_date[(assignment.truck_id, assignment.assignment_date)] = assignment.id
+        # New IDs are always the largest, so this is an append except when an
+        # update moves an older assignment onto another date
+        insort(self._by_date.setdefault(assignment.assignment_date, []), assignment.id)
+
+    def _remove_from_indexes(self, assignment: _AssignmentRecord) -> None:
+        """
+        Removes an assignment from the secondary indexes.
+
+        Args:
+            assignment: Stored assignment record being replaced or deleted
+        """
+        driver_key = (assignment.driver_id, assignment.assignment_date)
+        if self._by_driver_date.get(driver_key) == assignment.id:
+            del self._by_driver_date[driver_key]
+
+        truck_key = (assignment.truck_id, assignment.assignment_date)
+        if self._by_truck_date.get(truck_key) == assignment.id:
+            del self._by_truck_date[truck_key]
+
+        assignment_ids = self._by_date.get(assignment.assignment_date)
+        if assignment_ids is not None:
+            position = bisect_left(assignment_ids, assignment.id)
+            if position < len(assignment_ids) and assignment_ids[position] == assignment.id:
+                del assignment_ids[position]
+            if not assignment_ids:
+                del self._by_date[assignment.assignment_date]
@@ -3,7 +3,25 @@ Driver repository for data persistence operations.
 Implements the Repository Pattern to separate business logic from data access.
 """
 from typing import List, Optional
+from dataclasses import dataclass
 from app.models.driver import Driver
+from app.models.license_type import LicenseType
+
+
+@dataclass(slots=True)
+class _DriverRecord:
+    """Compact storage row for a driver that was validated on the way in"""
+    id: int
+    name: str
+    license_type: LicenseType
+
+    def to_model(self) -> Driver:
+        """Rebuilds the domain model without re-running validation"""
+        return Driver.model_construct(
+            id=self.id,
+            name=self.name,
+            license_type=self.license_type
+        )
 
 
 class DriverRepository:
@@ -14,7 +32,7 @@ class DriverRepository:
 
     def __init__(self):
         """Initialize the repository with empty storage"""
-        self._drivers: dict[int, Driver] = {}
+        self._drivers: dict[int, _DriverRecord] = {}
         self._next_id: int = 1
 
     def create(self, driver: Driver) -> Driver:
@@ -28,10 +46,22 @@ class DriverRepository:
             Driver: The created driver with assigned ID
         """
         driver.id = self._next_id
-        self._drivers[self._next_id] = driver
+        self._drivers[self._next_id] = _DriverRecord(driver.id, driver.name, driver.license_type)
         self._next_id += 1
         return driver
 
+    def bulk_create(self, drivers: List[Driver]) -> List[Driver]:
+        """
+        Creates several drivers in one call, assigning consecutive IDs.
+
+        Args:
+            drivers: Driver entities to create
+
+        Returns:
+            List[Driver]: The created drivers with assigned IDs, in input order
+        """
+        return [self.create(driver) for driver in drivers]
+
     def get_by_id(self, driver_id: int) -> Optional[Driver]:
         """
         Retrieves a driver by their ID.
@@ -42,7 +72,8 @@ class DriverRepository:
         Returns:
             Optional[Driver]: The driver if found, None otherwise
         """
-        return self._drivers.get(driver_id)
+        record = self._drivers.get(driver_id)
+        return record.to_model() if record is not None else None
 
     def get_all(self) -> List[Driver]:
         """
@@ -51,7 +82,7 @@ class DriverRepository:
         Returns:
             List[Driver]: List of all drivers
         """
-        return list(self._drivers.values())
+        return [record.to_model() for record in self._drivers.values()]
 
     def update(self, driver_id: int, driver: Driver) -> Optional[Driver]:
         """
@@ -68,7 +99,7 @@ class DriverRepository:
             return None
 
         driver.id = driver_id
-        self._drivers[driver_id] = driver
+        self._drivers[driver_id] = _DriverRecord(driver_id, driver.name, driver.license_type)
         return driver
 
     def delete(self, driver_id: int) -> bool:
@@ -97,3 +128,8 @@ class DriverRepository:
             bool: True if driver exists, False otherwise
         """
         return driver_id in self._drivers
+
+    def clear(self) -> None:
+        """Removes every driver and restarts ID assignment from 1"""
+        self._drivers.clear()
+        self._next_id = 1
@@ -3,7 +3,25 @@ Truck repository for data persistence operations.
 Implements the Repository Pattern to separate business logic from data access.
 """
 from typing import List, Optional
+from dataclasses import dataclass
 from app.models.truck import Truck
+from app.models.license_type import LicenseType
+
+
+@dataclass(slots=True)
+class _TruckRecord:
+    """Compact storage row for a truck that was validated on the way in"""
+    id: int
+    plate: str
+    minimum_license_type: LicenseType
+
+    def to_model(self) -> Truck:
+        """Rebuilds the domain model without re-running validation"""
+        return Truck.model_construct(
+            id=self.id,
+            plate=self.plate,
+            minimum_license_type=self.minimum_license_type
+        )
 
 
 class TruckRepository:
@@ -14,7 +32,7 @@ class TruckRepository:
 
     def __init__(self):
         """Initialize the repository with empty storage"""
-        self._trucks: dict[int, Truck] = {}
+        self._trucks: dict[int, _TruckRecord] = {}
         self._next_id: int = 1
 
     def create(self, truck: Truck) -> Truck:
@@ -28,10 +46,22 @@ class TruckRepository:
             Truck: The created truck with assigned ID
         """
         truck.id = self._next_id
-        self._trucks[self._next_id] = truck
+        self._trucks[self._next_id] = _TruckRecord(truck.id, truck.plate, truck.minimum_license_type)
         self._next_id += 1
         return truck
 
+    def bulk_create(self, trucks: List[Truck]) -> List[Truck]:
+        """
+        Creates several trucks in one call, assigning consecutive IDs.
+
+        Args:
+            trucks: Truck entities to create
+
+        Returns:
+            List[Truck]: The created trucks with assigned IDs, in input order
+        """
+        return [self.create(truck) for truck in trucks]
+
     def get_by_id(self, truck_id: int) -> Optional[Truck]:
         """
         Retrieves a truck by its ID.
@@ -42,7 +72,8 @@ class TruckRepository:
         Returns:
             Optional[Truck]: The truck if found, None otherwise
         """
-        return self._trucks.get(truck_id)
+        record = self._trucks.get(truck_id)
+        return record.to_model() if record is not None else None
 
     def get_all(self) -> List[Truck]:
         """
@@ -51,7 +82,7 @@ class TruckRepository:
         Returns:
             List[Truck]: List of all trucks
         """
-        return list(self._trucks.values())
+        return [record.to_model() for record in self._trucks.values()]
 
     def update(self, truck_id: int, truck: Truck) -> Optional[Truck]:
         """
@@ -68,7 +99,7 @@ class TruckRepository:
             return None
 
         truck.id = truck_id
-        self._trucks[truck_id] = truck
+        self._trucks[truck_id] = _TruckRecord(truck_id, truck.plate, truck.minimum_license_type)
         return truck
 
     def delete(self, truck_id: int) -> bool:
@@ -97,3 +128,8 @@ class TruckRepository:
             bool: True if truck exists, False otherwise
         """
         return truck_id in self._trucks
+
+    def clear(self) -> None:
+        """Removes every truck and restarts ID assignment from 1"""
+        self._trucks.clear()
+        self._next_id = 1
@@ -1,3 +1,12 @@
 """
 API routes for the application.
+
+Each router module follows the same conventions:
+
+- Services are singletons from app.dependencies, so every module resolves its
+  service once at import instead of through Depends() on each request.
+- Handlers return ORJSONResponse built from a module-level _to_payload()
+  dict, which skips FastAPI's jsonable_encoder and response_model
+  re-validation. response_model stays on the decorators for the OpenAPI
+  schema only. orjson serializes LicenseType members natively.
 """
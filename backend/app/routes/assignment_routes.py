@@ -2,28 +2,41 @@
 API routes for assignment management.
 Implements RESTful endpoints following best practices.
 """
-from typing import List
+from typing import Annotated, List
 from datetime import date
-from fastapi import APIRouter, Depends, Query, status
+import orjson
+from fastapi import APIRouter, Body, Query, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from app.schemas.assignment_schema import (
     AssignmentCreateRequest,
     AssignmentUpdateRequest,
-    AssignmentResponse
+    AssignmentResponse,
+    AssignmentBatchResponse
 )
-from app.services.assignment_service import AssignmentService
+from app.dependencies import get_assignment_service
+from app.routes.orjson_route import ORJSONRoute
 from app.models.assignment import Assignment
+from app.exceptions import ApplicationException
 
 
-router = APIRouter(prefix="/assignments", tags=["assignments"])
+router = APIRouter(prefix="/assignments", tags=["assignments"], route_class=ORJSONRoute)
 
+# Resolved once at import (see app.routes)
+_assignment_service = get_assignment_service()
+
+# Upper bound on items per batch request; the whole batch is validated and
+# inserted inside one request on the event loop, so it must stay small
+MAX_BATCH_SIZE = 100
 
-def get_assignment_service() -> AssignmentService:
-    """
-    Dependency injection for AssignmentService.
-    This allows easy testing and follows Dependency Inversion Principle.
-    """
-    from app.dependencies import get_assignment_service as get_service
-    return get_service()
+
+def _to_payload(assignment: Assignment) -> dict:
+    """Converts an assignment into a JSON-ready dict"""
+    return {
+        "id": assignment.id,
+        "driver_id": assignment.driver_id,
+        "truck_id": assignment.truck_id,
+        "assignment_date": assignment.assignment_date
+    }
 
 
 @router.post(
@@ -33,10 +46,9 @@ def get_assignment_service() -> AssignmentService:
     summary="Create a new assignment",
     description="Creates a new driver-truck assignment with validation"
 )
-def create_assignment(
-    request: AssignmentCreateRequest,
-    service: AssignmentService = Depends(get_assignment_service)
-) -> AssignmentResponse:
+async def create_assignment(
+    request: AssignmentCreateRequest
+) -> ORJSONResponse:
     """
     Create a new assignment.
 
@@ -48,23 +60,62 @@ def create_assignment(
 
     Args:
         request: Assignment creation request data
-        service: Injected assignment service
 
     Returns:
-        AssignmentResponse: The created assignment
+        ORJSONResponse: The created assignment
     """
     assignment = Assignment(
         driver_id=request.driver_id,
         truck_id=request.truck_id,
         assignment_date=request.assignment_date
     )
-    created_assignment = service.create_assignment(assignment)
-    return AssignmentResponse(
-        id=created_assignment.id,
-        driver_id=created_assignment.driver_id,
-        truck_id=created_assignment.truck_id,
-        assignment_date=created_assignment.assignment_date
+    created_assignment = _assignment_service.create_assignment(assignment)
+    return ORJSONResponse(_to_payload(created_assignment), status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/batch",
+    response_model=AssignmentBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Create assignments in batch",
+    description=(
+        "Creates several assignments in one request, reporting failures per item. "
+        f"At most {MAX_BATCH_SIZE} items are accepted per request."
     )
+)
+async def create_assignments_batch(
+    requests: Annotated[List[AssignmentCreateRequest], Body(max_length=MAX_BATCH_SIZE)]
+) -> ORJSONResponse:
+    """
+    Create several assignments in a single request.
+
+    Items are processed in order with the same validations as the single
+    create endpoint, so later items see assignments created by earlier ones.
+    A rejected item does not stop the remaining ones. Batches larger than
+    MAX_BATCH_SIZE are rejected with a 422 before any item is processed.
+
+    Args:
+        requests: Assignment creation requests
+
+    Returns:
+        ORJSONResponse: Created assignments and per-item errors
+    """
+    created = []
+    errors = []
+    for index, request in enumerate(requests):
+        assignment = Assignment(
+            driver_id=request.driver_id,
+            truck_id=request.truck_id,
+            assignment_date=request.assignment_date
+        )
+        try:
+            created_assignment = _assignment_service.create_assignment(assignment)
+        except ApplicationException as exc:
+            errors.append({"index": index, "detail": exc.message})
+        else:
+            created.append(_to_payload(created_assignment))
+
+    return ORJSONResponse({"created": created, "errors": errors})
 
 
 @router.get(
@@ -73,34 +124,47 @@ def create_assignment(
     summary="Get assignments",
     description="Retrieves assignments, optionally filtered by date"
 )
-def get_assignments(
-    assignment_date: date = Query(None, description="Filter by assignment date"),
-    service: AssignmentService = Depends(get_assignment_service)
-) -> List[AssignmentResponse]:
+async def get_assignments(
+    assignment_date: date = Query(None, description="Filter by assignment date")
+) -> ORJSONResponse:
     """
     Get assignments, optionally filtered by date.
 
     Args:
         assignment_date: Optional date filter
-        service: Injected assignment service
 
     Returns:
-        List[AssignmentResponse]: List of assignments
+        ORJSONResponse: List of assignments
     """
     if assignment_date:
-        assignments = service.get_assignments_by_date(assignment_date)
+        assignments = _assignment_service.get_assignments_by_date(assignment_date)
     else:
-        assignments = service.get_all_assignments()
-
-    return [
-        AssignmentResponse(
-            id=assignment.id,
-            driver_id=assignment.driver_id,
-            truck_id=assignment.truck_id,
-            assignment_date=assignment.assignment_date
-        )
-        for assignment in assignments
-    ]
+        assignments = _assignment_service.get_all_assignments()
+
+    return ORJSONResponse([_to_payload(assignment) for assignment in assignments])
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    summary="Stream all assignments",
+    description="Streams all assignments as newline-delimited JSON, one assignment per line"
+)
+async def stream_assignments() -> StreamingResponse:
+    """
+    Stream all assignments as NDJSON.
+
+    Each assignment is serialized as it is written to the client, so large
+    result sets do not need to be held in memory as a single response body.
+
+    Returns:
+        StreamingResponse: NDJSON stream of assignments
+    """
+    async def generate():
+        for assignment in _assignment_service.iter_all_assignments():
+            yield orjson.dumps(_to_payload(assignment)) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get(
@@ -109,27 +173,20 @@ def get_assignments(
     summary="Get an assignment by ID",
     description="Retrieves a specific assignment by its ID"
 )
-def get_assignment(
-    assignment_id: int,
-    service: AssignmentService = Depends(get_assignment_service)
-) -> AssignmentResponse:
+async def get_assignment(
+    assignment_id: int
+) -> ORJSONResponse:
     """
     Get an assignment by ID.
 
     Args:
         assignment_id: The assignment's unique identifier
-        service: Injected assignment service
 
     Returns:
-        AssignmentResponse: The requested assignment
+        ORJSONResponse: The requested assignment
     """
-    assignment = service.get_assignment(assignment_id)
-    return AssignmentResponse(
-        id=assignment.id,
-        driver_id=assignment.driver_id,
-        truck_id=assignment.truck_id,
-        assignment_date=assignment.assignment_date
-    )
+    assignment = _assignment_service.get_assignment(assignment_id)
+    return ORJSONResponse(_to_payload(assignment))
 
 
 @router.put(
@@ -138,11 +195,10 @@ def get_assignment(
     summary="Update an assignment",
     description="Updates an existing assignment with validation"
 )
-def update_assignment(
+async def update_assignment(
     assignment_id: int,
-    request: AssignmentUpdateRequest,
-    service: AssignmentService = Depends(get_assignment_service)
-) -> AssignmentResponse:
+    request: AssignmentUpdateRequest
+) -> ORJSONResponse:
     """
     Update an assignment.
 
@@ -156,23 +212,17 @@ def update_assignment(
     Args:
         assignment_id: The assignment's unique identifier
         request: Assignment update request data
-        service: Injected assignment service
 
     Returns:
-        AssignmentResponse: The updated assignment
+        ORJSONResponse: The updated assignment
     """
     assignment = Assignment(
         driver_id=request.driver_id,
         truck_id=request.truck_id,
         assignment_date=request.assignment_date
     )
-    updated_assignment = service.update_assignment(assignment_id, assignment)
-    return AssignmentResponse(
-        id=updated_assignment.id,
-        driver_id=updated_assignment.driver_id,
-        truck_id=updated_assignment.truck_id,
-        assignment_date=updated_assignment.assignment_date
-    )
+    updated_assignment = _assignment_service.update_assignment(assignment_id, assignment)
+    return ORJSONResponse(_to_payload(updated_assignment))
 
 
 @router.delete(
@@ -181,15 +231,13 @@ def update_assignment(
     summary="Delete an assignment",
     description="Deletes an assignment from the system"
 )
-def delete_assignment(
-    assignment_id: int,
-    service: AssignmentService = Depends(get_assignment_service)
+async def delete_assignment(
+    assignment_id: int
 ) -> None:
     """
     Delete an assignment.
 
     Args:
         assignment_id: The assignment's unique identifier
-        service: Injected assignment service
     """
-    service.delete_assignment(assignment_id)
+    _assignment_service.delete_assignment(assignment_id)
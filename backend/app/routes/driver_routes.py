@@ -3,22 +3,23 @@ API routes for driver management.
 Implements RESTful endpoints following best practices.
 """
 from typing import List
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, status
+from fastapi.responses import ORJSONResponse
 from app.schemas.driver_schema import DriverCreateRequest, DriverUpdateRequest, DriverResponse
-from app.services.driver_service import DriverService
+from app.dependencies import get_driver_service
+from app.routes.orjson_route import ORJSONRoute
 from app.models.driver import Driver
 
 
-router = APIRouter(prefix="/drivers", tags=["drivers"])
+router = APIRouter(prefix="/drivers", tags=["drivers"], route_class=ORJSONRoute)
 
+# Resolved once at import (see app.routes)
+_driver_service = get_driver_service()
 
-def get_driver_service() -> DriverService:
-    """
-    Dependency injection for DriverService.
-    This allows easy testing and follows Dependency Inversion Principle.
-    """
-    from app.dependencies import get_driver_service as get_service
-    return get_service()
+
+def _to_payload(driver: Driver) -> dict:
+    """Converts a driver into a JSON-ready dict"""
+    return {"id": driver.id, "name": driver.name, "license_type": driver.license_type}
 
 
 @router.post(
@@ -28,27 +29,21 @@ def get_driver_service() -> DriverService:
     summary="Create a new driver",
     description="Creates a new driver with the provided name and license type"
 )
-def create_driver(
-    request: DriverCreateRequest,
-    service: DriverService = Depends(get_driver_service)
-) -> DriverResponse:
+async def create_driver(
+    request: DriverCreateRequest
+) -> ORJSONResponse:
     """
     Create a new driver.
 
     Args:
         request: Driver creation request data
-        service: Injected driver service
 
     Returns:
-        DriverResponse: The created driver
+        ORJSONResponse: The created driver
     """
     driver = Driver(name=request.name, license_type=request.license_type)
-    created_driver = service.create_driver(driver)
-    return DriverResponse(
-        id=created_driver.id,
-        name=created_driver.name,
-        license_type=created_driver.license_type
-    )
+    created_driver = _driver_service.create_driver(driver)
+    return ORJSONResponse(_to_payload(created_driver), status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -57,23 +52,15 @@ def create_driver(
     summary="Get all drivers",
     description="Retrieves a list of all drivers"
 )
-def get_all_drivers(
-    service: DriverService = Depends(get_driver_service)
-) -> List[DriverResponse]:
+async def get_all_drivers() -> ORJSONResponse:
     """
     Get all drivers.
 
-    Args:
-        service: Injected driver service
-
     Returns:
-        List[DriverResponse]: List of all drivers
+        ORJSONResponse: List of all drivers
     """
-    drivers = service.get_all_drivers()
-    return [
-        DriverResponse(id=driver.id, name=driver.name, license_type=driver.license_type)
-        for driver in drivers
-    ]
+    drivers = _driver_service.get_all_drivers()
+    return ORJSONResponse([_to_payload(driver) for driver in drivers])
 
 
 @router.get(
@@ -82,26 +69,20 @@ def get_all_drivers(
     summary="Get a driver by ID",
     description="Retrieves a specific driver by their ID"
 )
-def get_driver(
-    driver_id: int,
-    service: DriverService = Depends(get_driver_service)
-) -> DriverResponse:
+async def get_driver(
+    driver_id: int
+) -> ORJSONResponse:
     """
     Get a driver by ID.
 
     Args:
         driver_id: The driver's unique identifier
-        service: Injected driver service
 
     Returns:
-        DriverResponse: The requested driver
+        ORJSONResponse: The requested driver
     """
-    driver = service.get_driver(driver_id)
-    return DriverResponse(
-        id=driver.id,
-        name=driver.name,
-        license_type=driver.license_type
-    )
+    driver = _driver_service.get_driver(driver_id)
+    return ORJSONResponse(_to_payload(driver))
 
 
 @router.put(
@@ -110,29 +91,23 @@ def get_driver(
     summary="Update a driver",
     description="Updates an existing driver's information"
 )
-def update_driver(
+async def update_driver(
     driver_id: int,
-    request: DriverUpdateRequest,
-    service: DriverService = Depends(get_driver_service)
-) -> DriverResponse:
+    request: DriverUpdateRequest
+) -> ORJSONResponse:
     """
     Update a driver.
 
     Args:
         driver_id: The driver's unique identifier
         request: Driver update request data
-        service: Injected driver service
 
     Returns:
-        DriverResponse: The updated driver
+        ORJSONResponse: The updated driver
     """
     driver = Driver(name=request.name, license_type=request.license_type)
-    updated_driver = service.update_driver(driver_id, driver)
-    return DriverResponse(
-        id=updated_driver.id,
-        name=updated_driver.name,
-        license_type=updated_driver.license_type
-    )
+    updated_driver = _driver_service.update_driver(driver_id, driver)
+    return ORJSONResponse(_to_payload(updated_driver))
 
 
 @router.delete(
@@ -141,15 +116,13 @@ def update_driver(
     summary="Delete a driver",
     description="Deletes a driver from the system"
 )
-def delete_driver(
-    driver_id: int,
-    service: DriverService = Depends(get_driver_service)
+async def delete_driver(
+    driver_id: int
 ) -> None:
     """
     Delete a driver.
 
     Args:
         driver_id: The driver's unique identifier
-        service: Injected driver service
     """
-    service.delete_driver(driver_id)
+    _driver_service.delete_driver(driver_id)
@@ -0,0 +1,48 @@
+"""
+Custom route class that decodes JSON request bodies with orjson.
+
+orjson follows RFC 8259 strictly. Unlike the stdlib parser, it rejects the
+NaN, Infinity and -Infinity literals, so bodies containing them are answered
+with a 422 ``json_invalid`` error.
+"""
+from typing import Any, Callable
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+class ORJSONRequest(Request):
+    """Request whose JSON body is parsed with orjson instead of the stdlib json module"""
+
+    async def json(self) -> Any:
+        """
+        Parses the request body as JSON.
+
+        orjson.JSONDecodeError subclasses json.JSONDecodeError, so FastAPI still
+        turns malformed bodies into a 422 validation error.
+
+        Returns:
+            Any: The decoded JSON body
+        """
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """API route that hands endpoints an ORJSONRequest for body parsing"""
+
+    def get_route_handler(self) -> Callable:
+        """
+        Wraps the default route handler so endpoints receive an ORJSONRequest.
+
+        Returns:
+            Callable: Handler that re-wraps the incoming request before
+                delegating to FastAPI's own handler
+        """
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
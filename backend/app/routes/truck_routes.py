@@ -3,22 +3,23 @@ API routes for truck management.
 Implements RESTful endpoints following best practices.
 """
 from typing import List
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, status
+from fastapi.responses import ORJSONResponse
 from app.schemas.truck_schema import TruckCreateRequest, TruckUpdateRequest, TruckResponse
-from app.services.truck_service import TruckService
+from app.dependencies import get_truck_service
+from app.routes.orjson_route import ORJSONRoute
 from app.models.truck import Truck
 
 
-router = APIRouter(prefix="/trucks", tags=["trucks"])
+router = APIRouter(prefix="/trucks", tags=["trucks"], route_class=ORJSONRoute)
 
+# Resolved once at import (see app.routes)
+_truck_service = get_truck_service()
 
-def get_truck_service() -> TruckService:
-    """
-    Dependency injection for TruckService.
-    This allows easy testing and follows Dependency Inversion Principle.
-    """
-    from app.dependencies import get_truck_service as get_service
-    return get_service()
+
+def _to_payload(truck: Truck) -> dict:
+    """Converts a truck into a JSON-ready dict"""
+    return {"id": truck.id, "plate": truck.plate, "minimum_license_type": truck.minimum_license_type}
 
 
 @router.post(
@@ -28,27 +29,21 @@ def get_truck_service() -> TruckService:
     summary="Create a new truck",
     description="Creates a new truck with the provided plate and minimum license type"
 )
-def create_truck(
-    request: TruckCreateRequest,
-    service: TruckService = Depends(get_truck_service)
-) -> TruckResponse:
+async def create_truck(
+    request: TruckCreateRequest
+) -> ORJSONResponse:
     """
     Create a new truck.
 
     Args:
         request: Truck creation request data
-        service: Injected truck service
 
     Returns:
-        TruckResponse: The created truck
+        ORJSONResponse: The created truck
     """
     truck = Truck(plate=request.plate, minimum_license_type=request.minimum_license_type)
-    created_truck = service.create_truck(truck)
-    return TruckResponse(
-        id=created_truck.id,
-        plate=created_truck.plate,
-        minimum_license_type=created_truck.minimum_license_type
-    )
+    created_truck = _truck_service.create_truck(truck)
+    return ORJSONResponse(_to_payload(created_truck), status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -57,27 +52,15 @@ def create_truck(
     summary="Get all trucks",
     description="Retrieves a list of all trucks"
 )
-def get_all_trucks(
-    service: TruckService = Depends(get_truck_service)
-) -> List[TruckResponse]:
+async def get_all_trucks() -> ORJSONResponse:
     """
     Get all trucks.
 
-    Args:
-        service: Injected truck service
-
     Returns:
-        List[TruckResponse]: List of all trucks
+        ORJSONResponse: List of all trucks
     """
-    trucks = service.get_all_trucks()
-    return [
-        TruckResponse(
-            id=truck.id,
-            plate=truck.plate,
-            minimum_license_type=truck.minimum_license_type
-        )
-        for truck in trucks
-    ]
+    trucks = _truck_service.get_all_trucks()
+    return ORJSONResponse([_to_payload(truck) for truck in trucks])
 
 
 @router.get(
@@ -86,26 +69,20 @@ def get_all_trucks(
     summary="Get a truck by ID",
     description="Retrieves a specific truck by its ID"
 )
-def get_truck(
-    truck_id: int,
-    service: TruckService = Depends(get_truck_service)
-) -> TruckResponse:
+async def get_truck(
+    truck_id: int
+) -> ORJSONResponse:
     """
     Get a truck by ID.
 
     Args:
         truck_id: The truck's unique identifier
-        service: Injected truck service
 
     Returns:
-        TruckResponse: The requested truck
+        ORJSONResponse: The requested truck
     """
-    truck = service.get_truck(truck_id)
-    return TruckResponse(
-        id=truck.id,
-        plate=truck.plate,
-        minimum_license_type=truck.minimum_license_type
-    )
+    truck = _truck_service.get_truck(truck_id)
+    return ORJSONResponse(_to_payload(truck))
 
 
 @router.put(
@@ -114,29 +91,23 @@ def get_truck(
     summary="Update a truck",
     description="Updates an existing truck's information"
 )
-def update_truck(
+async def update_truck(
     truck_id: int,
-    request: TruckUpdateRequest,
-    service: TruckService = Depends(get_truck_service)
-) -> TruckResponse:
+    request: TruckUpdateRequest
+) -> ORJSONResponse:
     """
     Update a truck.
 
     Args:
         truck_id: The truck's unique identifier
         request: Truck update request data
-        service: Injected truck service
 
     Returns:
-        TruckResponse: The updated truck
+        ORJSONResponse: The updated truck
     """
     truck = Truck(plate=request.plate, minimum_license_type=request.minimum_license_type)
-    updated_truck = service.update_truck(truck_id, truck)
-    return TruckResponse(
-        id=updated_truck.id,
-        plate=updated_truck.plate,
-        minimum_license_type=updated_truck.minimum_license_type
-    )
+    updated_truck = _truck_service.update_truck(truck_id, truck)
+    return ORJSONResponse(_to_payload(updated_truck))
 
 
 @router.delete(
@@ -145,15 +116,13 @@ def update_truck(
     summary="Delete a truck",
     description="Deletes a truck from the system"
 )
-def delete_truck(
-    truck_id: int,
-    service: TruckService = Depends(get_truck_service)
+async def delete_truck(
+    truck_id: int
 ) -> None:
     """
     Delete a truck.
 
     Args:
         truck_id: The truck's unique identifier
-        service: Injected truck service
     """
-    service.delete_truck(truck_id)
+    _truck_service.delete_truck(truck_id)
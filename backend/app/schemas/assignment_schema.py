@@ -1,8 +1,9 @@
 """
 API schemas for assignment-related requests and responses.
 """
+from typing import List
 from datetime import date
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AssignmentCreateRequest(BaseModel):
@@ -11,14 +12,16 @@ class AssignmentCreateRequest(BaseModel):
     truck_id: int = Field(..., gt=0, description="ID of the truck")
     assignment_date: date = Field(..., description="Date of the assignment")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "driver_id": 1,
                 "truck_id": 1,
                 "assignment_date": "2025-11-10"
             }
         }
+    )
 
 
 class AssignmentUpdateRequest(BaseModel):
@@ -27,14 +30,16 @@ class AssignmentUpdateRequest(BaseModel):
     truck_id: int = Field(..., gt=0, description="ID of the truck")
     assignment_date: date = Field(..., description="Date of the assignment")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "driver_id": 1,
                 "truck_id": 1,
                 "assignment_date": "2025-11-10"
             }
         }
+    )
 
 
 class AssignmentResponse(BaseModel):
@@ -44,8 +49,8 @@ class AssignmentResponse(BaseModel):
     truck_id: int = Field(..., description="ID of the truck")
     assignment_date: date = Field(..., description="Date of the assignment")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "driver_id": 1,
@@ -53,3 +58,37 @@ class AssignmentResponse(BaseModel):
                 "assignment_date": "2025-11-10"
             }
         }
+    )
+
+
+class AssignmentBatchError(BaseModel):
+    """Schema for an assignment that could not be created in a batch"""
+    index: int = Field(..., description="Position of the item in the batch request")
+    detail: str = Field(..., description="Reason the assignment was rejected")
+
+
+class AssignmentBatchResponse(BaseModel):
+    """Schema for batch assignment creation response"""
+    created: List[AssignmentResponse] = Field(..., description="Assignments that were created")
+    errors: List[AssignmentBatchError] = Field(..., description="Items that were rejected")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "created": [
+                    {
+                        "id": 1,
+                        "driver_id": 1,
+                        "truck_id": 1,
+                        "assignment_date": "2025-11-10"
+                    }
+                ],
+                "errors": [
+                    {
+                        "index": 1,
+                        "detail": "Driver 1 is already assigned to truck 1 on 2025-11-10"
+                    }
+                ]
+            }
+        }
+    )
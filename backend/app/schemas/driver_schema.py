@@ -1,7 +1,7 @@
 """
 API schemas for driver-related requests and responses.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from app.models.license_type import LicenseType
 
 
@@ -10,13 +10,15 @@ class DriverCreateRequest(BaseModel):
     name: str = Field(..., min_length=1, max_length=100, description="Driver's full name")
     license_type: LicenseType = Field(..., description="Type of driver's license")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "name": "John Doe",
                 "license_type": "D"
             }
         }
+    )
 
 
 class DriverUpdateRequest(BaseModel):
@@ -24,13 +26,15 @@ class DriverUpdateRequest(BaseModel):
     name: str = Field(..., min_length=1, max_length=100, description="Driver's full name")
     license_type: LicenseType = Field(..., description="Type of driver's license")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "name": "John Doe",
                 "license_type": "D"
             }
         }
+    )
 
 
 class DriverResponse(BaseModel):
@@ -39,11 +43,12 @@ class DriverResponse(BaseModel):
     name: str = Field(..., description="Driver's full name")
     license_type: LicenseType = Field(..., description="Type of driver's license")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "name": "John Doe",
                 "license_type": "D"
             }
         }
+    )
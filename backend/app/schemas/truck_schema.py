@@ -1,7 +1,7 @@
 """
 API schemas for truck-related requests and responses.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from app.models.license_type import LicenseType
 
 
@@ -10,13 +10,15 @@ class TruckCreateRequest(BaseModel):
     plate: str = Field(..., min_length=1, max_length=20, description="Truck's license plate")
     minimum_license_type: LicenseType = Field(..., description="Minimum license required")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "plate": "ABC-1234",
                 "minimum_license_type": "C"
             }
         }
+    )
 
 
 class TruckUpdateRequest(BaseModel):
@@ -24,13 +26,15 @@ class TruckUpdateRequest(BaseModel):
     plate: str = Field(..., min_length=1, max_length=20, description="Truck's license plate")
     minimum_license_type: LicenseType = Field(..., description="Minimum license required")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "plate": "ABC-1234",
                 "minimum_license_type": "C"
             }
         }
+    )
 
 
 class TruckResponse(BaseModel):
@@ -39,11 +43,12 @@ class TruckResponse(BaseModel):
     plate: str = Field(..., description="Truck's license plate")
     minimum_license_type: LicenseType = Field(..., description="Minimum license required")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "plate": "ABC-1234",
                 "minimum_license_type": "C"
             }
         }
+    )
@@ -2,7 +2,7 @@
 Assignment service containing business logic for driver-truck assignments.
 Implements complex business rules and validations.
 """
-from typing import List
+from typing import Iterator, List
 from datetime import date
 from app.models.assignment import Assignment
 from app.models.license_type import LicenseType
@@ -68,11 +68,12 @@ class AssignmentService:
         # Validate license compatibility
         self._validate_license_compatibility(driver.license_type, truck.minimum_license_type)
 
-        # Check for driver conflicts on the same date
-        self._check_driver_availability(assignment.driver_id, assignment.assignment_date)
-
-        # Check for truck conflicts on the same date
-        self._check_truck_availability(assignment.truck_id, assignment.assignment_date)
+        # Check for driver and truck conflicts on the same date
+        self._check_availability(
+            assignment.driver_id,
+            assignment.truck_id,
+            assignment.assignment_date
+        )
 
         # If all validations pass, create the assignment
         return self._assignment_repo.create(assignment)
@@ -104,6 +105,15 @@ class AssignmentService:
         """
         return self._assignment_repo.get_all()
 
+    def iter_all_assignments(self) -> Iterator[Assignment]:
+        """
+        Iterates over all assignments without materializing them as a list.
+
+        Returns:
+            Iterator[Assignment]: Iterator over all assignments
+        """
+        return self._assignment_repo.iter_all()
+
     def get_assignments_by_date(self, assignment_date: date) -> List[Assignment]:
         """
         Retrieves all assignments for a specific date.
@@ -150,19 +160,22 @@ class AssignmentService:
         # Validate license compatibility
         self._validate_license_compatibility(driver.license_type, truck.minimum_license_type)
 
-        # Check for driver conflicts (excluding current assignment)
-        self._check_driver_availability(
-            assignment.driver_id,
-            assignment.assignment_date,
-            exclude_assignment_id=assignment_id
-        )
-
-        # Check for truck conflicts (excluding current assignment)
-        self._check_truck_availability(
-            assignment.truck_id,
-            assignment.assignment_date,
-            exclude_assignment_id=assignment_id
-        )
+        # Check for driver and truck conflicts (excluding current assignment).
+        # The assignment already holds its own driver and truck slots, so the
+        # lookup is only needed when one of them moves. Existence and license
+        # checks above always run, since drivers and trucks can change independently.
+        date_changed = existing_assignment.assignment_date != assignment.assignment_date
+        if (
+            date_changed
+            or existing_assignment.driver_id != assignment.driver_id
+            or existing_assignment.truck_id != assignment.truck_id
+        ):
+            self._check_availability(
+                assignment.driver_id,
+                assignment.truck_id,
+                assignment.assignment_date,
+                exclude_assignment_id=assignment_id
+            )
 
         # If all validations pass, update the assignment
         return self._assignment_repo.update(assignment_id, assignment)
@@ -203,49 +216,38 @@ class AssignmentService:
                 f"Driver needs at least a {required_license.value} license."
             )
 
-    def _check_driver_availability(
+    def _check_availability(
         self,
         driver_id: int,
+        truck_id: int,
         assignment_date: date,
         exclude_assignment_id: int = None
     ) -> None:
         """
-        Checks if a driver is available on a specific date.
+        Checks if both a driver and a truck are available on a specific date.
 
         Args:
             driver_id: The driver's ID
+            truck_id: The truck's ID
             assignment_date: The date to check
             exclude_assignment_id: Optional assignment ID to exclude from check (for updates)
 
         Raises:
-            ConflictException: If driver is already assigned on that date
+            ConflictException: If driver or truck is already assigned on that date
         """
-        existing = self._assignment_repo.find_by_driver_and_date(driver_id, assignment_date)
-        if existing and existing.id != exclude_assignment_id:
+        driver_conflict_id, truck_conflict_id = self._assignment_repo.conflicts(
+            driver_id, truck_id, assignment_date
+        )
+
+        if driver_conflict_id is not None and driver_conflict_id != exclude_assignment_id:
+            existing = self._assignment_repo.get_by_id(driver_conflict_id)
             raise ConflictException(
                 f"Driver {driver_id} is already assigned to truck {existing.truck_id} "
                 f"on {assignment_date}"
             )
 
-    def _check_truck_availability(
-        self,
-        truck_id: int,
-        assignment_date: date,
-        exclude_assignment_id: int = None
-    ) -> None:
-        """
-        Checks if a truck is available on a specific date.
-
-        Args:
-            truck_id: The truck's ID
-            assignment_date: The date to check
-            exclude_assignment_id: Optional assignment ID to exclude from check (for updates)
-
-        Raises:
-            ConflictException: If truck is already assigned on that date
-        """
-        existing = self._assignment_repo.find_by_truck_and_date(truck_id, assignment_date)
-        if existing and existing.id != exclude_assignment_id:
+        if truck_conflict_id is not None and truck_conflict_id != exclude_assignment_id:
+            existing = self._assignment_repo.get_by_id(truck_conflict_id)
             raise ConflictException(
                 f"Truck {truck_id} is already assigned to driver {existing.driver_id} "
                 f"on {assignment_date}"
@@ -0,0 +1,95 @@
+"""
+Shared pytest fixtures.
+"""
+from typing import List, Optional
+import pytest
+from httpx import ASGITransport, AsyncClient
+from app import dependencies
+from app.main import app
+from app.models.assignment import Assignment
+from app.models.driver import Driver
+from app.models.license_type import LicenseType
+from app.models.truck import Truck
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """In-process async client shared by every API test in the session"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _reset_repositories():
+    """Start every test module from empty app repositories"""
+    dependencies._assignment_repository.clear()
+    dependencies._driver_repository.clear()
+    dependencies._truck_repository.clear()
+    yield
+
+
+@pytest.fixture
+def seed():
+    """
+    Inserts records straight into the app's repositories, skipping HTTP.
+
+    Use it for setup data so that only the behaviour under test goes through
+    the API. Assignments are stored as given, without conflict checks.
+    Everything seeded is deleted again when the test finishes, keeping the
+    shared store small for tests that list everything.
+    """
+    seeded_drivers: List[Driver] = []
+    seeded_trucks: List[Truck] = []
+    seeded_assignments: List[Assignment] = []
+
+    def _seed(
+        drivers: Optional[List[Driver]] = None,
+        trucks: Optional[List[Truck]] = None,
+        assignments: Optional[List[Assignment]] = None
+    ):
+        created = (
+            dependencies._driver_repository.bulk_create(drivers or []),
+            dependencies._truck_repository.bulk_create(trucks or []),
+            dependencies._assignment_repository.bulk_create(assignments or [])
+        )
+        seeded_drivers.extend(created[0])
+        seeded_trucks.extend(created[1])
+        seeded_assignments.extend(created[2])
+        return created
+
+    yield _seed
+
+    for assignment in seeded_assignments:
+        dependencies._assignment_repository.delete(assignment.id)
+    for truck in seeded_trucks:
+        dependencies._truck_repository.delete(truck.id)
+    for driver in seeded_drivers:
+        dependencies._driver_repository.delete(driver.id)
+
+
+@pytest.fixture
+def seeded_driver_d(seed) -> Driver:
+    """A driver with license D, inserted without going through the API"""
+    (driver,), _, _ = seed(drivers=[Driver(name="Seed Driver D", license_type=LicenseType.D)])
+    return driver
+
+
+@pytest.fixture
+def seeded_driver_b(seed) -> Driver:
+    """A driver with license B, inserted without going through the API"""
+    (driver,), _, _ = seed(drivers=[Driver(name="Seed Driver B", license_type=LicenseType.B)])
+    return driver
+
+
+@pytest.fixture
+def seeded_truck_c(seed) -> Truck:
+    """A truck requiring license C, inserted without going through the API"""
+    _, (truck,), _ = seed(trucks=[Truck(plate="SEED-C", minimum_license_type=LicenseType.C)])
+    return truck
+
+
+@pytest.fixture
+def seeded_truck_d(seed) -> Truck:
+    """A truck requiring license D, inserted without going through the API"""
+    _, (truck,), _ = seed(trucks=[Truck(plate="SEED-D", minimum_license_type=LicenseType.D)])
+    return truck
@@ -22,14 +22,22 @@ from app.exceptions import (
 class TestAssignmentService:
     """Test suite for AssignmentService"""
 
-    @pytest.fixture
-    def service(self):
-        """Create a fresh service instance for each test"""
+    @pytest.fixture(scope="session")
+    def _service_singleton(self):
+        """Build the service and its repositories once per test session"""
         driver_repo = DriverRepository()
         truck_repo = TruckRepository()
         assignment_repo = AssignmentRepository()
         return AssignmentService(assignment_repo, driver_repo, truck_repo)
 
+    @pytest.fixture
+    def service(self, _service_singleton):
+        """Hand each test the shared service with empty repositories"""
+        _service_singleton._assignment_repo.clear()
+        _service_singleton._driver_repo.clear()
+        _service_singleton._truck_repo.clear()
+        return _service_singleton
+
     @pytest.fixture
     def driver_with_license_d(self, service):
         """Create a driver with license D"""
@@ -85,8 +93,8 @@ class TestAssignmentService:
         with pytest.raises(ResourceNotFoundException) as exc_info:
             service.create_assignment(assignment)
 
-        assert "Driver" in str(exc_info.value.message)
-        assert "999" in str(exc_info.value.message)
+        assert "Driver" in exc_info.value.message
+        assert "999" in exc_info.value.message
 
     def test_create_assignment_truck_not_found(self, service, driver_with_license_d):
         """Test assignment creation with non-existent truck"""
@@ -99,8 +107,8 @@ class TestAssignmentService:
         with pytest.raises(ResourceNotFoundException) as exc_info:
             service.create_assignment(assignment)
 
-        assert "Truck" in str(exc_info.value.message)
-        assert "999" in str(exc_info.value.message)
+        assert "Truck" in exc_info.value.message
+        assert "999" in exc_info.value.message
 
     def test_create_assignment_incompatible_license(
         self,
@@ -118,8 +126,8 @@ class TestAssignmentService:
         with pytest.raises(ValidationException) as exc_info:
             service.create_assignment(assignment)
 
-        assert "license type B" in str(exc_info.value.message)
-        assert "license type C" in str(exc_info.value.message)
+        assert "license type B" in exc_info.value.message
+        assert "license type C" in exc_info.value.message
 
     def test_create_assignment_driver_already_assigned(
         self,
@@ -147,7 +155,7 @@ class TestAssignmentService:
         with pytest.raises(ConflictException) as exc_info:
             service.create_assignment(assignment2)
 
-        assert "already assigned" in str(exc_info.value.message)
+        assert "already assigned" in exc_info.value.message
 
     def test_create_assignment_truck_already_assigned(
         self,
@@ -175,7 +183,7 @@ class TestAssignmentService:
         with pytest.raises(ConflictException) as exc_info:
             service.create_assignment(assignment2)
 
-        assert "already assigned" in str(exc_info.value.message)
+        assert "already assigned" in exc_info.value.message
 
     def test_create_assignment_same_day_different_date_allowed(
         self,
@@ -226,6 +234,37 @@ class TestAssignmentService:
         all_assignments = service.get_all_assignments()
         assert len(all_assignments) == 2
 
+    def test_get_all_assignments_reflects_writes(
+        self,
+        service,
+        driver_with_license_d,
+        truck_requiring_c
+    ):
+        """Test that repeated listings pick up creates, updates and deletes"""
+        first = service.create_assignment(Assignment(
+            driver_id=driver_with_license_d.id,
+            truck_id=truck_requiring_c.id,
+            assignment_date=date(2025, 11, 10)
+        ))
+        assert [a.id for a in service.get_all_assignments()] == [first.id]
+
+        second = service.create_assignment(Assignment(
+            driver_id=driver_with_license_d.id,
+            truck_id=truck_requiring_c.id,
+            assignment_date=date(2025, 11, 11)
+        ))
+        assert [a.id for a in service.get_all_assignments()] == [first.id, second.id]
+
+        service.update_assignment(first.id, Assignment(
+            driver_id=driver_with_license_d.id,
+            truck_id=truck_requiring_c.id,
+            assignment_date=date(2025, 11, 12)
+        ))
+        assert service.get_all_assignments()[0].assignment_date == date(2025, 11, 12)
+
+        service.delete_assignment(second.id)
+        assert [a.id for a in service.get_all_assignments()] == [first.id]
+
     def test_get_assignments_by_date(
         self,
         service,
@@ -272,3 +311,113 @@ class TestAssignmentService:
 
         with pytest.raises(ResourceNotFoundException):
             service.get_assignment(created.id)
+
+    def test_update_assignment_releases_previous_date(
+        self,
+        service,
+        driver_with_license_d,
+        truck_requiring_c,
+        truck_requiring_b
+    ):
+        """Test that moving an assignment to another date frees the original date"""
+        created = service.create_assignment(Assignment(
+            driver_id=driver_with_license_d.id,
+            truck_id=truck_requiring_c.id,
+            assignment_date=date(2025, 11, 10)
+        ))
+
+        service.update_assignment(created.id, Assignment(
+            driver_id=driver_with_license_d.id,
+            truck_id=truck_requiring_c.id,
+            assignment_date=date(2025, 11, 12)
+        ))
+
+        # Original date is free again for the same driver
+        reassigned = service.create_assignment(Assignment(
+            driver_id=driver_with_license_d.id,
+            truck_id=truck_requiring_b.id,
+            assignment_date=date(2025, 11, 10)
+        ))
+
+        assert reassigned.id is not None
+        assert service.get_assignments_by_date(date(2025, 11, 12))[0].id == created.id
+
+    def test_update_assignment_unchanged_slots(
+        self,
+        service,
+        driver_with_license_d,
+        truck_requiring_c
+    ):
+        """Test that re-saving an assignment with the same data succeeds"""
+        created = service.create_assignment(Assignment(
+            driver_id=driver_with_license_d.id,
+            truck_id=truck_requiring_c.id,
+            assignment_date=date(2025, 11, 10)
+        ))
+
+        updated = service.update_assignment(created.id, Assignment(
+            driver_id=driver_with_license_d.id,
+            truck_id=truck_requiring_c.id,
+            assignment_date=date(2025, 11, 10)
+        ))
+
+        assert updated.id == created.id
+        assert service.get_assignment(created.id).assignment_date == date(2025, 11, 10)
+
+    def test_update_assignment_driver_conflict(
+        self,
+        service,
+        driver_with_license_d,
+        truck_requiring_c,
+        truck_requiring_b
+    ):
+        """Test that an update cannot move a driver onto an already booked date"""
+        service.create_assignment(Assignment(
+            driver_id=driver_with_license_d.id,
+            truck_id=truck_requiring_c.id,
+            assignment_date=date(2025, 11, 10)
+        ))
+        other = service.create_assignment(Assignment(
+            driver_id=driver_with_license_d.id,
+            truck_id=truck_requiring_b.id,
+            assignment_date=date(2025, 11, 11)
+        ))
+
+        with pytest.raises(ConflictException) as exc_info:
+            service.update_assignment(other.id, Assignment(
+                driver_id=driver_with_license_d.id,
+                truck_id=truck_requiring_b.id,
+                assignment_date=date(2025, 11, 10)
+            ))
+
+        assert "already assigned" in exc_info.value.message
+
+    def test_get_assignments_by_date_ordered_after_update(
+        self,
+        service,
+        driver_with_license_d,
+        driver_with_license_b,
+        truck_requiring_c,
+        truck_requiring_b
+    ):
+        """Test that moving an older assignment onto a date keeps ID order"""
+        older = service.create_assignment(Assignment(
+            driver_id=driver_with_license_d.id,
+            truck_id=truck_requiring_c.id,
+            assignment_date=date(2025, 11, 10)
+        ))
+        newer = service.create_assignment(Assignment(
+            driver_id=driver_with_license_b.id,
+            truck_id=truck_requiring_b.id,
+            assignment_date=date(2025, 11, 11)
+        ))
+
+        service.update_assignment(older.id, Assignment(
+            driver_id=driver_with_license_d.id,
+            truck_id=truck_requiring_c.id,
+            assignment_date=date(2025, 11, 11)
+        ))
+
+        assignments = service.get_assignments_by_date(date(2025, 11, 11))
+        assert [a.id for a in assignments] == [older.id, newer.id]
+        assert service.get_assignments_by_date(date(2025, 11, 10)) == []
@@ -19,38 +19,39 @@ class TestLicenseType:
         assert hierarchy[LicenseType.D.value] == 4
         assert hierarchy[LicenseType.E.value] == 5
 
-    def test_can_operate_same_license(self):
-        """Test that a license can operate vehicles requiring the same license"""
-        assert LicenseType.C.can_operate(LicenseType.C)
-        assert LicenseType.D.can_operate(LicenseType.D)
-
-    def test_can_operate_lower_license(self):
-        """Test that higher licenses can operate vehicles requiring lower licenses"""
-        assert LicenseType.E.can_operate(LicenseType.A)
-        assert LicenseType.E.can_operate(LicenseType.B)
-        assert LicenseType.E.can_operate(LicenseType.C)
-        assert LicenseType.E.can_operate(LicenseType.D)
-
-        assert LicenseType.D.can_operate(LicenseType.A)
-        assert LicenseType.D.can_operate(LicenseType.B)
-        assert LicenseType.D.can_operate(LicenseType.C)
-
-        assert LicenseType.C.can_operate(LicenseType.A)
-        assert LicenseType.C.can_operate(LicenseType.B)
-
-    def test_cannot_operate_higher_license(self):
-        """Test that lower licenses cannot operate vehicles requiring higher licenses"""
-        assert not LicenseType.A.can_operate(LicenseType.B)
-        assert not LicenseType.A.can_operate(LicenseType.C)
-        assert not LicenseType.A.can_operate(LicenseType.D)
-        assert not LicenseType.A.can_operate(LicenseType.E)
-
-        assert not LicenseType.B.can_operate(LicenseType.C)
-        assert not LicenseType.B.can_operate(LicenseType.D)
-        assert not LicenseType.B.can_operate(LicenseType.E)
-
-        assert not LicenseType.C.can_operate(LicenseType.D)
-        assert not LicenseType.C.can_operate(LicenseType.E)
+    @pytest.mark.parametrize(
+        "holder, required, expected",
+        [
+            (LicenseType.A, LicenseType.A, True),
+            (LicenseType.A, LicenseType.B, False),
+            (LicenseType.A, LicenseType.C, False),
+            (LicenseType.A, LicenseType.D, False),
+            (LicenseType.A, LicenseType.E, False),
+            (LicenseType.B, LicenseType.A, True),
+            (LicenseType.B, LicenseType.B, True),
+            (LicenseType.B, LicenseType.C, False),
+            (LicenseType.B, LicenseType.D, False),
+            (LicenseType.B, LicenseType.E, False),
+            (LicenseType.C, LicenseType.A, True),
+            (LicenseType.C, LicenseType.B, True),
+            (LicenseType.C, LicenseType.C, True),
+            (LicenseType.C, LicenseType.D, False),
+            (LicenseType.C, LicenseType.E, False),
+            (LicenseType.D, LicenseType.A, True),
+            (LicenseType.D, LicenseType.B, True),
+            (LicenseType.D, LicenseType.C, True),
+            (LicenseType.D, LicenseType.D, True),
+            (LicenseType.D, LicenseType.E, False),
+            (LicenseType.E, LicenseType.A, True),
+            (LicenseType.E, LicenseType.B, True),
+            (LicenseType.E, LicenseType.C, True),
+            (LicenseType.E, LicenseType.D, True),
+            (LicenseType.E, LicenseType.E, True)
+        ]
+    )
+    def test_can_operate(self, holder, required, expected):
+        """Test that a license can operate exactly the vehicles at or below its level"""
+        assert holder.can_operate(required) is expected
 
     def test_get_compatible_licenses(self):
         """Test getting all compatible licenses for a given license type"""
@@ -62,3 +63,12 @@ class TestLicenseType:
 
         # License E can operate all licenses
         assert LicenseType.E.get_compatible_licenses() == {"A", "B", "C", "D", "E"}
+
+    def test_license_hierarchy_is_read_only(self):
+        """Test that callers cannot alter the shared hierarchy"""
+        hierarchy = LicenseType.get_license_hierarchy()
+
+        with pytest.raises(TypeError):
+            hierarchy["A"] = 10
+
+        assert LicenseType.get_license_hierarchy()["A"] == 1